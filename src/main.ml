@@ -13,8 +13,10 @@ type token =
   | Tok_eof
 
 let usage_msg =
-  "Usage: dune exec main -- <input-file>\n\
-  \   or: dune exec main -- <num> <op> <num>  (where op is +, *, or -)"
+  "Usage: dune exec main -- <input-file>  (use - to read from stdin)\n\
+  \   or: dune exec main -- <num> <op> <num>  (where op is +, *, or -)\n\
+  \   or: dune exec main -- --serve  (one result line per stdin line)\n\
+  \   or: dune exec main -- --arith <input-file>  (lines of <num> <op> <num>)"
 
 let max_reduction_steps = 1000
 let is_letter c = ('a' <= c && c <= 'z') || ('A' <= c && c <= 'Z')
@@ -36,6 +38,23 @@ let read_file filename =
     close_in_noerr channel;
     raise e
 
+(* Read everything from standard input into a string. *)
+let read_stdin () =
+  let buffer = Buffer.create 4096 in
+  let chunk = Bytes.create 4096 in
+  let rec loop () =
+    let count = input stdin chunk 0 (Bytes.length chunk) in
+    if count > 0 then (
+      Buffer.add_subbytes buffer chunk 0 count;
+      loop ())
+  in
+  loop ();
+  Buffer.contents buffer
+
+(* Read the program source; "-" stands for standard input. *)
+let read_input filename =
+  if filename = "-" then read_stdin () else read_file filename
+
 let tokenize source : token list =
   let len = String.length source in
   let rec lex idx acc =
@@ -121,16 +140,28 @@ let parse tokens : expr =
   | Tok_eof :: _ -> raise (Syntax_error "Input string not fully parsed")
   | _ -> raise (Syntax_error "Input string not fully parsed")
 
-let rec render expr =
-  match expr with
-  | Var name -> name
-  | App (lhs, rhs) ->
-      let left = render lhs in
-      let right = render rhs in
-      "(" ^ left ^ " " ^ right ^ ")"
-  | Abs (name, body) ->
-      let body_str = render body in
-      "(\\" ^ name ^ " " ^ body_str ^ ")"
+(* Render into a single growing buffer; concatenating with ^ at every node
+   copies each subterm once per enclosing level. *)
+let render expr =
+  let buffer = Buffer.create 64 in
+  let rec emit expr =
+    match expr with
+    | Var name -> Buffer.add_string buffer name
+    | App (lhs, rhs) ->
+        Buffer.add_char buffer '(';
+        emit lhs;
+        Buffer.add_char buffer ' ';
+        emit rhs;
+        Buffer.add_char buffer ')'
+    | Abs (name, body) ->
+        Buffer.add_string buffer "(\\";
+        Buffer.add_string buffer name;
+        Buffer.add_char buffer ' ';
+        emit body;
+        Buffer.add_char buffer ')'
+  in
+  emit expr;
+  Buffer.contents buffer
 
 (* Beta-reduction and alpha-conversion *)
 
@@ -183,21 +214,25 @@ let rec alpha_convert old_name new_name expr =
       if x = old_name then Abs (new_name, alpha_convert old_name new_name body)
       else Abs (x, alpha_convert old_name new_name body)
 
-(* Substitute: replace variable x with expression n in expression m. *)
-let rec substitute m x n =
-  match m with
-  | Var y -> if y = x then n else Var y
-  | App (e1, e2) -> App (substitute e1 x n, substitute e2 x n)
-  | Abs (y, body) ->
-      if y = x then Abs (y, body)
-      else
-        let free_in_n = free_vars n in
-        if mem y free_in_n then
-          let all_vars = free_vars m @ free_vars n in
+(* Substitute: replace variable x with expression n in expression m.
+   The free variables of n do not change while walking m, so they are
+   collected once instead of at every abstraction. *)
+let substitute m x n =
+  let free_in_n = free_vars n in
+  let rec replace m =
+    match m with
+    | Var y -> if y = x then n else Var y
+    | App (e1, e2) -> App (replace e1, replace e2)
+    | Abs (y, body) ->
+        if y = x then Abs (y, body)
+        else if mem y free_in_n then
+          let all_vars = free_vars m @ free_in_n in
           let fresh = fresh_var y all_vars in
           let renamed_body = alpha_convert y fresh body in
-          Abs (fresh, substitute renamed_body x n)
-        else Abs (y, substitute body x n)
+          Abs (fresh, replace renamed_body)
+        else Abs (y, replace body)
+  in
+  replace m
 
 (* Attempt one beta-reduction step using Normal Order (leftmost-outermost). *)
 let rec beta_reduce_step expr =
@@ -235,19 +270,21 @@ let process_expression line =
   let reduced = reduce ast 0 in
   render reduced
 
-(* Split string into lines *)
-let split_lines source =
-  let len = String.length source in
-  let rec split_at start idx acc =
+(* Split a line into whitespace-separated words *)
+let split_words line =
+  let len = String.length line in
+  let is_space c = c = ' ' || c = '\t' || c = '\r' in
+  let rec scan start idx acc =
     if idx >= len then
       if start = idx then List.rev acc
-      else List.rev (String.sub source start (idx - start) :: acc)
-    else if source.[idx] = '\n' then
-      let line = String.sub source start (idx - start) in
-      split_at (idx + 1) (idx + 1) (line :: acc)
-    else split_at start (idx + 1) acc
+      else List.rev (String.sub line start (idx - start) :: acc)
+    else if is_space line.[idx] then
+      if start = idx then scan (idx + 1) (idx + 1) acc
+      else
+        scan (idx + 1) (idx + 1) (String.sub line start (idx - start) :: acc)
+    else scan start (idx + 1) acc
   in
-  if len = 0 then [] else split_at 0 0 []
+  scan 0 0 []
 
 (* List map *)
 let rec map f lst = match lst with [] -> [] | h :: t -> f h :: map f t
@@ -260,11 +297,44 @@ let is_blank_line line =
   in
   loop 0
 
+(* Split string into lines, dropping blank ones in the same pass *)
+let non_blank_lines source =
+  let len = String.length source in
+  let add_line start stop acc =
+    let line = String.sub source start (stop - start) in
+    if is_blank_line line then acc else line :: acc
+  in
+  let rec split_at start idx acc =
+    if idx >= len then List.rev (add_line start idx acc)
+    else if source.[idx] = '\n' then
+      split_at (idx + 1) (idx + 1) (add_line start idx acc)
+    else split_at start (idx + 1) acc
+  in
+  split_at 0 0 []
+
 let process_file filename =
-  let source = read_file filename in
-  let expressions = split_lines source in
-  let non_blank = filter (fun line -> not (is_blank_line line)) expressions in
-  map process_expression non_blank
+  let source = read_input filename in
+  map process_expression (non_blank_lines source)
+
+(* Serve mode: answer every line read from stdin with exactly one line of
+   output, reporting errors in place so the process keeps running. *)
+let serve () =
+  let rec loop () =
+    match input_line stdin with
+    | exception End_of_file -> ()
+    | line ->
+        let output =
+          if is_blank_line line then ""
+          else
+            try process_expression line with
+            | Syntax_error msg -> "ERR: Syntax_error: " ^ msg
+            | Reduction_limit steps ->
+                "ERR: Reduction_limit: " ^ int_to_string steps
+        in
+        print_endline output;
+        loop ()
+  in
+  loop ()
 
 (* Church numerals and arithmetic *)
 
@@ -322,28 +392,45 @@ let church_sub =
   let n = Var "n" in
   Abs ("m", Abs ("n", App (App (n, church_pred), m)))
 
+(* Build the Church-numeral expression for <num> <op> <num> *)
+let arithmetic_expression num1_str op_str num2_str =
+  let num1 = int_of_string num1_str in
+  let num2 = int_of_string num2_str in
+  let church1 = church_encode num1 in
+  let church2 = church_encode num2 in
+  match op_str with
+  | "+" -> App (App (church_add, church1), church2)
+  | "*" -> App (App (church_mult, church1), church2)
+  | "-" -> App (App (church_sub, church1), church2)
+  | _ ->
+      raise
+        (Invalid_argument
+           ("Unknown operator: " ^ op_str ^ " (supported: +, *, -)"))
+
 (* Parse arithmetic expression from command line arguments *)
 let parse_arithmetic () =
   if Array.length Sys.argv <> 4 then
     raise
       (Invalid_argument
          "Arithmetic mode requires exactly 3 arguments: <num> <op> <num>")
-  else
-    let num1_str = Sys.argv.(1) in
-    let op_str = Sys.argv.(2) in
-    let num2_str = Sys.argv.(3) in
-    let num1 = int_of_string num1_str in
-    let num2 = int_of_string num2_str in
-    let church1 = church_encode num1 in
-    let church2 = church_encode num2 in
-    match op_str with
-    | "+" -> App (App (church_add, church1), church2)
-    | "*" -> App (App (church_mult, church1), church2)
-    | "-" -> App (App (church_sub, church1), church2)
-    | _ ->
-        raise
-          (Invalid_argument
-             ("Unknown operator: " ^ op_str ^ " (supported: +, *, -)"))
+  else arithmetic_expression Sys.argv.(1) Sys.argv.(2) Sys.argv.(3)
+
+(* Evaluate one "<num> <op> <num>" line, reporting errors in place. *)
+let process_arithmetic line =
+  match split_words line with
+  | [ num1_str; op_str; num2_str ] -> (
+      try render (reduce (arithmetic_expression num1_str op_str num2_str) 0)
+      with
+      | Invalid_argument msg -> "ERR: Invalid_argument: " ^ msg
+      | Failure msg -> "ERR: Failure: " ^ msg
+      | Reduction_limit steps ->
+          "ERR: Reduction_limit: " ^ int_to_string steps)
+  | _ -> "ERR: Invalid_argument: Expected <num> <op> <num>"
+
+(* Batch arithmetic mode: one result line per non-blank input line *)
+let process_arithmetic_file filename =
+  let source = read_input filename in
+  map process_arithmetic (non_blank_lines source)
 
 (* List iteration *)
 let rec iter f lst =
@@ -355,11 +442,18 @@ let rec iter f lst =
 
 let () =
   match Array.length Sys.argv with
+  | 2 when Sys.argv.(1) = "--serve" ->
+      (* Serve mode: keep reading expressions from stdin until EOF *)
+      serve ()
   | 2 ->
-      (* File mode: interpret expressions from file *)
+      (* File mode: interpret expressions from file (or stdin for "-") *)
       let input_file = Sys.argv.(1) in
       let outputs = process_file input_file in
       iter print_endline outputs
+  | 3 when Sys.argv.(1) = "--arith" ->
+      (* Batch arithmetic mode: many <num> <op> <num> lines in one run *)
+      let outputs = process_arithmetic_file Sys.argv.(2) in
+      iter print_endline outputs
   | 4 ->
       (* Arithmetic mode: <num> <op> <num> *)
       let expr = parse_arithmetic () in
@@ -0,0 +1,14 @@
+Church numeral arithmetic:
+  $ main 2 + 3
+  (\f (\x (f (f (f (f (f x)))))))
+  $ main 5 - 2
+  (\f (\x (f (f (f x)))))
+
+Batch arithmetic evaluates every line in one run:
+  $ printf '%s\n' '0 + 0' '2 + 3' '2 * 3' '5 - 2' '2 / 3' '1 - 3' | main --arith -
+  (\f (\x x))
+  (\f (\x (f (f (f (f (f x)))))))
+  (\f (\x (f (f (f (f (f (f x))))))))
+  (\f (\x (f (f (f x)))))
+  ERR: Invalid_argument: Unknown operator: / (supported: +, *, -)
+  (\f (\x x))
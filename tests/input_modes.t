@@ -0,0 +1,18 @@
+Reading from stdin:
+  $ printf '%s\n' 'x' '(\x x) y' '' 'f x y' | main -
+  x
+  y
+  ((f x) y)
+  $ main - < fixtures/simple_variables.txt
+  x
+  y
+  foo
+  bar123
+
+Serve mode answers each line and keeps going after errors:
+  $ printf '%s\n' '(\x x) y' '\x' 'f x' '(\x (x x))(\x (x x))' 'g' | main --serve
+  y
+  ERR: Syntax_error: Missing expression after lambda abstraction
+  (f x)
+  ERR: Reduction_limit: 1000
+  g
@@ -0,0 +1,11 @@
+Interpreter fixtures:
+  $ main fixtures/beta_simple.txt
+  (\y y)
+  (x y)
+  (\x (\y (x (\z y))))
+  $ main fixtures/beta_reduction.txt
+  (x x)
+  $ main fixtures/alpha_conversion.txt
+  (\y1 (\z y))
+  $ main fixtures/normal_order.txt
+  y
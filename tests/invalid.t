@@ -0,0 +1,16 @@
+Invalid inputs should fail:
+  $ main fixtures/invalid_missing_var.txt
+  Fatal error: exception Dune__exe__Main.Syntax_error("Missing variable after lambda")
+  [2]
+  $ main fixtures/invalid_missing_body.txt
+  Fatal error: exception Dune__exe__Main.Syntax_error("Missing expression after lambda abstraction")
+  [2]
+  $ main fixtures/invalid_unclosed_paren.txt
+  Fatal error: exception Dune__exe__Main.Syntax_error("Missing closing parenthesis")
+  [2]
+  $ main fixtures/invalid_unexpected_char.txt
+  Fatal error: exception Dune__exe__Main.Syntax_error("Unexpected character: +")
+  [2]
+  $ main fixtures/invalid_number_start.txt
+  Fatal error: exception Dune__exe__Main.Syntax_error("Unexpected character: 1")
+  [2]
@@ -0,0 +1,4 @@
+Omega combinator should hit reduction limit:
+  $ main fixtures/omega.txt
+  Fatal error: exception Dune__exe__Main.Reduction_limit(1000)
+  [2]
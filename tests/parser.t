@@ -1,4 +1,4 @@
-Test fixtures:
+Parser fixtures:
   $ main fixtures/empty.txt
   $ main fixtures/blank_lines.txt
   $ main fixtures/simple_variables.txt
@@ -36,35 +36,70 @@ Test fixtures:
   ((f x) y)
   y
   (\x (\y x))
-  $ main fixtures/beta_simple.txt
-  (\y y)
-  (x y)
-  (\x (\y (x (\z y))))
-  $ main fixtures/beta_reduction.txt
-  (x x)
-  $ main fixtures/alpha_conversion.txt
-  (\y1 (\z y))
-  $ main fixtures/normal_order.txt
+  $ main fixtures/identifiers.txt
+  a
+  b
+  c
+  d
+  e
+  f
+  g
+  h
+  i
+  j
+  k
+  l
+  m
+  n
+  o
+  p
+  q
+  r
+  s
+  t
+  u
+  v
+  w
+  x
   y
-
-Invalid inputs should fail:
-  $ main fixtures/invalid_missing_var.txt
-  Fatal error: exception Dune__exe__Main.Syntax_error("Missing variable after lambda")
-  [2]
-  $ main fixtures/invalid_missing_body.txt
-  Fatal error: exception Dune__exe__Main.Syntax_error("Missing expression after lambda abstraction")
-  [2]
-  $ main fixtures/invalid_unclosed_paren.txt
-  Fatal error: exception Dune__exe__Main.Syntax_error("Missing closing parenthesis")
-  [2]
-  $ main fixtures/invalid_unexpected_char.txt
-  Fatal error: exception Dune__exe__Main.Syntax_error("Unexpected character: +")
-  [2]
-  $ main fixtures/invalid_number_start.txt
-  Fatal error: exception Dune__exe__Main.Syntax_error("Unexpected character: 1")
-  [2]
-
-Omega combinator should hit reduction limit:
-  $ main fixtures/omega.txt
-  Fatal error: exception Dune__exe__Main.Reduction_limit(1000)
-  [2]
+  z
+  A
+  B
+  C
+  D
+  E
+  F
+  G
+  H
+  I
+  J
+  K
+  L
+  M
+  N
+  O
+  P
+  Q
+  R
+  S
+  T
+  U
+  V
+  W
+  X
+  Y
+  Z
+  abc
+  x1
+  var123
+  fooBar
+  $ main fixtures/whitespace.txt
+  x
+  (\x x)
+  (f x)
+  (f x)
+  x
+  (f x)
+  (f (g h))
+  (\x (\y x))
+  (\y y)